@@ -1,10 +1,21 @@
+import os
+import sys
+
 import uvicorn # type: ignore
 
 if __name__ == "__main__":
-    # Run using uvicorn with import string
+    # Hot-reloading only works with a single process, so keep it behind --dev
+    dev_mode = "--dev" in sys.argv[1:]
+    # Chats and analysis caches live in process memory, so default to a single
+    # worker until that state moves out of the process
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+
+    # Run using uvicorn with import string so each worker imports the app itself
     uvicorn.run(
         "src.main:app",  # Use import string format "module:variable"
         host="0.0.0.0",  # Listen on all network interfaces
         port=8000,
-        reload=True,     # Enable hot-reloading for development
+        reload=dev_mode,  # Enable hot-reloading for development
+        workers=1 if dev_mode else workers,
+        access_log=False  # Requests are already logged by the app middleware
     )
\ No newline at end of file
@@ -2,51 +2,87 @@
 """
 Build Rust components and install them in the current Python environment.
 """
+import importlib.util
 import subprocess
 import sys
 import os
 from pathlib import Path
 
-def main():
+def get_latest_source_mtime(root_dir: Path) -> float:
     """
-    Build Rust components using maturin and install them.
+    Get the most recent modification time of the Rust sources and manifests.
+    """
+    sources = list((root_dir / "src").rglob("*.rs"))
+    sources += [
+        path for path in (root_dir / "cargo.toml", root_dir / "Cargo.toml", root_dir / "Cargo.lock")
+        if path.exists()
+    ]
+    return max((path.stat().st_mtime for path in sources), default=0.0)
+
+def get_latest_wheel(wheels_dir: Path):
     """
-    print("Building Rust components...")
+    Get the most recently built wheel, or None if there is none.
+    """
+    return max(wheels_dir.glob("*.whl"), key=os.path.getctime, default=None)
+
+def main(force: bool = False, exec_install: bool = False):
+    """
+    Build Rust components using maturin and install them.
     
+    The build is skipped when the newest wheel is more recent than every
+    Rust source file, unless force is set. If the module is also already
+    installed, nothing is reinstalled either.
+    
+    With exec_install, pip replaces the current process for the final
+    install step, so this should only be used when running as a script.
+    """
     # Get the project root directory
     root_dir = Path(__file__).parent.parent
+    wheels_dir = root_dir / "target" / "wheels"
     
-    # Run maturin build
-    try:
-        subprocess.run(
-            ["maturin", "build", "--release"],
-            cwd=root_dir,
-            check=True
-        )
-        print("✅ Rust build successful")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Rust build failed: {e}")
-        sys.exit(1)
+    latest_wheel = get_latest_wheel(wheels_dir)
+    if (
+        not force
+        and latest_wheel is not None
+        and latest_wheel.stat().st_mtime >= get_latest_source_mtime(root_dir)
+    ):
+        print(f"✅ Rust sources unchanged, using cached wheel: {latest_wheel.name}")
+        if importlib.util.find_spec("whatsapp_parser") is not None:
+            return
+    else:
+        print("Building Rust components...")
+        
+        # Run maturin build
+        try:
+            subprocess.run(
+                ["maturin", "build", "--release"],
+                cwd=root_dir,
+                check=True
+            )
+            print("✅ Rust build successful")
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Rust build failed: {e}")
+            sys.exit(1)
+        
+        latest_wheel = get_latest_wheel(wheels_dir)
     
     # Install the built wheel
     try:
-        wheels_dir = root_dir / "target" / "wheels"
-        wheel_files = list(wheels_dir.glob("*.whl"))
-        
-        if not wheel_files:
+        if latest_wheel is None:
             print("❌ No wheel file found after build")
             sys.exit(1)
         
-        # Install the latest wheel
-        latest_wheel = max(wheel_files, key=os.path.getctime)
-        subprocess.run(
-            ["pip", "install", "--force-reinstall", str(latest_wheel)],
-            check=True
-        )
+        # Install the latest wheel (dependencies are already installed)
+        pip_args = ["pip", "install", "--force-reinstall", "--no-deps", str(latest_wheel)]
+        if exec_install:
+            sys.stdout.flush()
+            os.execvp("pip", pip_args)
+        
+        subprocess.run(pip_args, check=True)
         print(f"✅ Installed wheel: {latest_wheel.name}")
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed to install wheel: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(force="--force" in sys.argv[1:], exec_install=True)
\ No newline at end of file
@@ -2,39 +2,46 @@
 """
 Run pre-start checks before starting the API server.
 """
+import os
 import sys
 import logging
 from pathlib import Path
 import subprocess
 import importlib.util
 
+ROOT_DIR = Path(__file__).parent.parent
+
+# NLTK resources used by the analysis modules, mapped to their data category
+NLTK_RESOURCES = {
+    "stopwords": "corpora",
+    "vader_lexicon": "sentiment",
+}
+
 def check_rust_module():
     """
     Check if Rust module is available and build it if needed.
     """
-    try:
-        # Using dynamic import to avoid static type checking errors
-        whatsapp_parser = importlib.import_module("whatsapp_parser")
+    # Look up the module spec only, without executing the extension module
+    if importlib.util.find_spec("whatsapp_parser") is not None:
         logging.info("✅ Rust parser module is available")
         return True
-    except ImportError:
-        logging.warning("⚠️ Rust parser module not found, trying to build...")
-        try:
-            root_dir = Path(__file__).parent.parent
-            build_script = root_dir / "scripts" / "build_rust.py"
-            
-            if build_script.exists():
-                spec = importlib.util.spec_from_file_location("build_rust", build_script)
-                build_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(build_module)
-                build_module.main()
-                return True
-            else:
-                logging.error("❌ Build script not found")
-                return False
-        except Exception as e:
-            logging.error(f"❌ Failed to build Rust module: {e}")
+
+    logging.warning("⚠️ Rust parser module not found, trying to build...")
+    try:
+        build_script = ROOT_DIR / "scripts" / "build_rust.py"
+
+        if build_script.exists():
+            spec = importlib.util.spec_from_file_location("build_rust", build_script)
+            build_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(build_module)
+            build_module.main()
+            return True
+        else:
+            logging.error("❌ Build script not found")
             return False
+    except Exception as e:
+        logging.error(f"❌ Failed to build Rust module: {e}")
+        return False
 
 def check_nltk_data():
     """
@@ -42,15 +49,29 @@ def check_nltk_data():
     """
     try:
         import nltk # type: ignore
-        
-        for resource in ["punkt", "stopwords", "vader_lexicon"]:
+
+        missing = []
+        for resource, category in NLTK_RESOURCES.items():
             try:
-                nltk.data.find(f"tokenizers/{resource}" if resource == "punkt" else f"corpora/{resource}")
+                nltk.data.find(f"{category}/{resource}")
                 logging.info(f"✅ NLTK {resource} is available")
             except LookupError:
                 logging.warning(f"⚠️ NLTK {resource} not found, downloading...")
-                nltk.download(resource)
-        
+                missing.append(resource)
+
+        if missing:
+            # Download into NLTK_DATA when set so cached CI directories are reused.
+            # Downloads run one at a time, since nltk's shared Downloader
+            # isn't safe to call from several threads.
+            download_dir = os.environ.get("NLTK_DATA")
+            results = [
+                nltk.download(resource, download_dir=download_dir, quiet=True)
+                for resource in missing
+            ]
+            if not all(results):
+                logging.error("❌ Some NLTK resources could not be downloaded")
+                return False
+
         return True
     except Exception as e:
         logging.error(f"❌ NLTK data check failed: {e}")
@@ -60,13 +81,10 @@ def check_storage_directories():
     """
     Check if storage directories exist and create them if needed.
     """
-    root_dir = Path(__file__).parent.parent
-    storage_dir = root_dir / "storage"
-    media_dir = storage_dir / "media"
+    media_dir = ROOT_DIR / "storage" / "media"
     
     try:
-        storage_dir.mkdir(exist_ok=True)
-        media_dir.mkdir(exist_ok=True)
+        media_dir.mkdir(parents=True, exist_ok=True)
         logging.info("✅ Storage directories are ready")
         return True
     except Exception as e:
@@ -1,7 +1,12 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException # type: ignore
 from typing import List, Optional
 import os
+import uuid
 from datetime import datetime
+from pathlib import Path
+
+from src.utils.audio import save_upload_async, get_audio_duration
+from src.utils.executors import run_file_io
 
 router = APIRouter(
     prefix="/audio",
@@ -9,29 +14,55 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Uploaded recordings are stored alongside the other media files, in the
+# same backend storage directory that scripts/pretest.py prepares
+ROOT_DIR = Path(__file__).resolve().parents[3]
+AUDIO_STORAGE_DIR = ROOT_DIR / "storage" / "media"
+MAX_AUDIO_SIZE = 100 * 1024 * 1024  # 100 MB
+
+# .webm is what the frontend's in-browser recorder produces
+ALLOWED_AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a", ".ogg", ".webm"})
+ALLOWED_AUDIO_EXTENSIONS_STR = ", ".join(sorted(ALLOWED_AUDIO_EXTENSIONS))
+
 @router.post("/upload")
 async def upload_audio(file: UploadFile = File(...)):
     """
     Upload an audio file
     """
-    # In a real implementation, you would save the file and process it
     filename = file.filename
     
     # Validate file type
-    allowed_extensions = [".mp3", ".wav", ".m4a", ".ogg"]
     file_ext = os.path.splitext(filename)[1].lower()
     
-    if file_ext not in allowed_extensions:
+    if file_ext not in ALLOWED_AUDIO_EXTENSIONS:
         raise HTTPException(
             status_code=400, 
-            detail=f"Invalid file type. Allowed types: {', '.join(allowed_extensions)}"
+            detail=f"Invalid file type. Allowed types: {ALLOWED_AUDIO_EXTENSIONS_STR}"
         )
     
-    # In a real app, you would save the file
-    # Here we'll just return a success message
+    # Stream the upload to disk in chunks so memory use stays bounded
+    # and oversized files are rejected without reading them fully.
+    # The whole copy, including creating the storage directory, runs as
+    # one job on the file I/O pool.
+    recording_id = uuid.uuid4().hex
+    file_path = AUDIO_STORAGE_DIR / f"{recording_id}{file_ext}"
+    
+    file_size, file_hash = await save_upload_async(file.file, file_path, MAX_AUDIO_SIZE)
+    
+    if file_size > MAX_AUDIO_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size is {MAX_AUDIO_SIZE // (1024 * 1024)} MB"
+        )
+    
+    duration = await run_file_io(get_audio_duration, file_path)
+    
     return {
+        "id": recording_id,
         "filename": filename,
-        "size": file.size,
+        "size": file_size,
+        "sha256": file_hash,
+        "duration": duration,
         "content_type": file.content_type,
         "upload_time": datetime.now().isoformat(),
         "status": "success"
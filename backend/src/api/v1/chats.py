@@ -1,14 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException, Query # type: ignore
-from typing import List, Optional, Dict, Any
+from fastapi.responses import ORJSONResponse # type: ignore
+from fastapi.concurrency import run_in_threadpool # type: ignore
+from typing import List, Optional, Dict, Any, Callable
 from pydantic import BaseModel # type: ignore
 from datetime import datetime
+from functools import partial
+import asyncio
 
 # Import the functions we created
 from src.core.analysis.statistics import calculate_chat_statistics, extract_keywords
+from src.models.schemas import Message as AnalysisMessage
 
 router = APIRouter(
     prefix="/chats",
     tags=["chats"],
+    default_response_class=ORJSONResponse,
     responses={404: {"description": "Not found"}},
 )
 
@@ -42,6 +48,93 @@ sample_chats = [
     }
 ]
 
+# Index chats by ID so lookups don't scan the whole list
+sample_chats_by_id = {chat["id"]: chat for chat in sample_chats}
+
+# Computed statistics and keywords, keyed by the chat fingerprint (plus
+# top_n for keywords).
+# Entries are futures stored before the computation finishes, so concurrent
+# requests for the same chat share one computation instead of each starting
+# their own.
+_statistics_cache: Dict[tuple, Any] = {}
+_keywords_cache: Dict[tuple, Any] = {}
+
+def to_analysis_messages(chat: Dict[str, Any]) -> List[AnalysisMessage]:
+    """
+    Build the message objects the analysis functions expect, once per chat.
+    
+    Args:
+        chat: Chat dict with raw message dicts
+    
+    Returns:
+        List[AnalysisMessage]: Parsed messages with datetime timestamps
+    """
+    return [AnalysisMessage(**message) for message in chat["messages"]]
+
+def chat_fingerprint(chat: Dict[str, Any]) -> tuple:
+    """
+    Identify the current state of a chat's messages for caching.
+    
+    Args:
+        chat: Chat dict
+    
+    Returns:
+        tuple: (chat_id, updated_at, message count, last message ID)
+    """
+    messages = chat["messages"]
+    last_message_id = messages[-1]["id"] if messages else ""
+    return (chat["id"], chat["updated_at"], len(messages), last_message_id)
+
+def analyze_chat(func: Callable[..., Any], chat: Dict[str, Any]) -> Any:
+    """
+    Build the analysis messages for a chat and run an analysis function on them.
+    
+    Args:
+        func: Analysis function taking a list of messages
+        chat: Chat dict to analyze
+    
+    Returns:
+        Any: Return value of the analysis function
+    """
+    return func(to_analysis_messages(chat))
+
+def get_or_start_analysis(cache: Dict[tuple, Any], key: tuple, func: Callable[..., Any], chat: Dict[str, Any]) -> "asyncio.Future":
+    """
+    Get the cached analysis future for a key, or start computing it.
+    
+    Message validation and the analysis run together in a worker thread, so
+    neither blocks the event loop.
+    
+    Args:
+        cache: Cache the future is stored in
+        key: Cache key for this chat and its parameters
+        func: Analysis function taking a list of messages
+        chat: Chat dict to analyze
+    
+    Returns:
+        asyncio.Future: Future resolving to the analysis result
+    """
+    future = cache.get(key)
+    if future is None:
+        future = asyncio.ensure_future(run_in_threadpool(analyze_chat, func, chat))
+        
+        def drop_failed(done: "asyncio.Future"):
+            # Don't cache failures, so the next request retries
+            if (done.cancelled() or done.exception() is not None) and cache.get(key) is done:
+                del cache[key]
+        
+        future.add_done_callback(drop_failed)
+        cache[key] = future
+    return future
+
+def invalidate_chat_cache(chat_id: str):
+    """
+    Drop cached statistics and keywords for a chat after it changes.
+    """
+    for cache in (_statistics_cache, _keywords_cache):
+        for key in [key for key in cache if key[0] == chat_id]:
+            del cache[key]
+
 @router.get("/")
 async def get_chats():
     """
@@ -54,10 +147,10 @@ async def get_chat(chat_id: str):
     """
     Get a specific chat by ID
     """
-    for chat in sample_chats:
-        if chat["id"] == chat_id:
-            return chat
-    raise HTTPException(status_code=404, detail="Chat not found")
+    chat = sample_chats_by_id.get(chat_id)
+    if not chat:
+        raise HTTPException(status_code=404, detail="Chat not found")
+    return chat
 
 @router.post("/")
 async def create_chat(chat: Chat):
@@ -67,6 +160,17 @@ async def create_chat(chat: Chat):
     # In a real app, you would save to a database
     new_chat = chat.dict()
     sample_chats.append(new_chat)
+    sample_chats_by_id[new_chat["id"]] = new_chat
+    invalidate_chat_cache(new_chat["id"])
+    
+    # Chats rarely change after creation, so start computing statistics on
+    # write and let reads pick up the result
+    get_or_start_analysis(
+        _statistics_cache,
+        chat_fingerprint(new_chat),
+        calculate_chat_statistics,
+        new_chat
+    )
     return new_chat
 
 @router.get("/{chat_id}/statistics")
@@ -74,21 +178,28 @@ async def get_chat_statistics(chat_id: str):
     """
     Get statistics for a specific chat
     """
-    for chat in sample_chats:
-        if chat["id"] == chat_id:
-            stats = calculate_chat_statistics(chat["messages"])
-            return stats
-    raise HTTPException(status_code=404, detail="Chat not found")
+    chat = sample_chats_by_id.get(chat_id)
+    if not chat:
+        raise HTTPException(status_code=404, detail="Chat not found")
+    
+    cache_key = chat_fingerprint(chat)
+    # Shield the shared future so a cancelled request (e.g. a client
+    # disconnect) doesn't cancel the computation for other waiters
+    return await asyncio.shield(
+        get_or_start_analysis(_statistics_cache, cache_key, calculate_chat_statistics, chat)
+    )
 
 @router.get("/{chat_id}/keywords")
 async def get_chat_keywords(chat_id: str, top_n: int = Query(10, ge=1, le=100)):
     """
     Get keywords from a specific chat
     """
-    for chat in sample_chats:
-        if chat["id"] == chat_id:
-            # Combine all message content
-            all_text = " ".join([msg["content"] for msg in chat["messages"]])
-            keywords = extract_keywords(all_text, top_n=top_n)
-            return {"keywords": keywords, "count": len(keywords)}
-    raise HTTPException(status_code=404, detail="Chat not found")
\ No newline at end of file
+    chat = sample_chats_by_id.get(chat_id)
+    if not chat:
+        raise HTTPException(status_code=404, detail="Chat not found")
+    
+    cache_key = (*chat_fingerprint(chat), top_n)
+    analysis = await asyncio.shield(get_or_start_analysis(
+        _keywords_cache, cache_key, partial(extract_keywords, limit=top_n), chat
+    ))
+    return {"keywords": analysis.keywords, "count": len(analysis.keywords)}
\ No newline at end of file
@@ -1,7 +1,8 @@
 from typing import List, Dict, Any
 from datetime import datetime
 import logging
-from collections import defaultdict
+from functools import lru_cache
+import numpy as np # type: ignore
 import nltk # type: ignore
 from nltk.sentiment.vader import SentimentIntensityAnalyzer # type: ignore
 
@@ -17,6 +18,19 @@ except LookupError:
 
 sentiment_analyzer = SentimentIntensityAnalyzer()
 
+@lru_cache(maxsize=100_000)
+def compound_score(text: str) -> float:
+    """
+    Get the VADER compound score for a text, cached for repeated messages.
+    
+    Args:
+        text: Text to score
+    
+    Returns:
+        float: Compound sentiment score (-1 to 1)
+    """
+    return sentiment_analyzer.polarity_scores(text)["compound"]
+
 def analyze_chat_sentiment(messages: List[Message]) -> SentimentAnalysis:
     """
     Analyze sentiment of messages in the chat.
@@ -33,42 +47,49 @@ def analyze_chat_sentiment(messages: List[Message]) -> SentimentAnalysis:
             daily=[]
         )
     
-    # Group messages by date
-    messages_by_date = defaultdict(list)
+    # Collect text messages with the index of the day they belong to
+    texts = []
+    day_index = []
+    day_positions: Dict[str, int] = {}
     for message in messages:
         # Skip system messages and media
         if message.type != "text":
             continue
         
         date_key = message.timestamp.strftime("%Y-%m-%d")
-        messages_by_date[date_key].append(message)
+        texts.append(message.content)
+        day_index.append(day_positions.setdefault(date_key, len(day_positions)))
     
-    # Calculate sentiment for each day
-    daily_sentiments = []
-    all_scores = []
+    if not texts:
+        return SentimentAnalysis(
+            overall=SentimentScore(score=0.0, label=SentimentLabel.NEUTRAL),
+            daily=[]
+        )
     
-    for date, date_messages in sorted(messages_by_date.items()):
-        # Combine all messages for this date
-        combined_text = " ".join([msg.content for msg in date_messages])
-        
-        # Calculate sentiment
-        sentiment = sentiment_analyzer.polarity_scores(combined_text)
-        compound_score = sentiment["compound"]
-        all_scores.append(compound_score)
-        
-        # Determine sentiment label
-        label = get_sentiment_label(compound_score)
-        
+    # Score each message once, then average the scores per day
+    compound_scores = np.fromiter(
+        (compound_score(text) for text in texts),
+        dtype=np.float64,
+        count=len(texts)
+    )
+    day_index = np.asarray(day_index)
+    day_counts = np.bincount(day_index, minlength=len(day_positions))
+    day_scores = np.bincount(day_index, weights=compound_scores, minlength=len(day_positions)) / day_counts
+    
+    day_labels = get_sentiment_labels(day_scores)
+    
+    daily_sentiments = []
+    for date, position in sorted(day_positions.items()):
         daily_sentiments.append(
             DailySentiment(
                 date=date,
-                sentiment=SentimentScore(score=compound_score, label=label),
-                message_count=len(date_messages)
+                sentiment=SentimentScore(score=float(day_scores[position]), label=day_labels[position]),
+                message_count=int(day_counts[position])
             )
         )
     
     # Calculate overall sentiment
-    overall_score = sum(all_scores) / len(all_scores) if all_scores else 0.0
+    overall_score = float(day_scores.mean())
     overall_label = get_sentiment_label(overall_score)
     
     return SentimentAnalysis(
@@ -93,6 +114,26 @@ def get_sentiment_label(score: float) -> SentimentLabel:
     else:
         return SentimentLabel.NEUTRAL
 
+# Labels indexed by (score >= 0.05) + 2 * (score <= -0.05)
+_LABELS_BY_INDEX = np.array(
+    [SentimentLabel.NEUTRAL, SentimentLabel.POSITIVE, SentimentLabel.NEGATIVE],
+    dtype=object
+)
+
+def get_sentiment_labels(scores: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of sentiment scores to labels without per-score branching.
+    
+    Args:
+        scores: Array of sentiment scores (-1 to 1)
+    
+    Returns:
+        np.ndarray: Array of SentimentLabel values, same thresholds as get_sentiment_label
+    """
+    scores = np.asarray(scores)
+    index = (scores >= 0.05).astype(np.intp) + 2 * (scores <= -0.05)
+    return _LABELS_BY_INDEX[index]
+
 def analyze_message_sentiment(message: Message) -> SentimentScore:
     """
     Analyze sentiment of a single message.
@@ -106,8 +147,7 @@ def analyze_message_sentiment(message: Message) -> SentimentScore:
     if message.type != "text":
         return SentimentScore(score=0.0, label=SentimentLabel.NEUTRAL)
     
-    sentiment = sentiment_analyzer.polarity_scores(message.content)
-    compound_score = sentiment["compound"]
-    label = get_sentiment_label(compound_score)
+    score = compound_score(message.content)
+    label = get_sentiment_label(score)
     
-    return SentimentScore(score=compound_score, label=label)
\ No newline at end of file
+    return SentimentScore(score=score, label=label)
\ No newline at end of file
@@ -1,10 +1,12 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from collections import Counter, defaultdict
 from datetime import datetime
+from itertools import filterfalse
+import calendar
 import logging
 import re
+import numpy as np # type: ignore
 import nltk # type: ignore
-from nltk.tokenize import word_tokenize # type: ignore
 from nltk.corpus import stopwords # type: ignore
 
 from src.models.schemas import (
@@ -21,14 +23,30 @@ logger = logging.getLogger(__name__)
 
 # Initialize NLTK resources
 try:
-    nltk.data.find('tokenizers/punkt')
     nltk.data.find('corpora/stopwords')
 except LookupError:
-    nltk.download('punkt')
     nltk.download('stopwords')
 
 # Get stopwords
-STOP_WORDS = set(stopwords.words('english'))
+STOP_WORDS = frozenset(stopwords.words('english'))
+
+# Alphabetic words of at least 3 characters (unicode letters, no digits or underscores)
+WORD_PATTERN = re.compile(r'[^\W\d_]{3,}')
+
+def most_common_values(values: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    Count integer values, ordered like Counter.most_common().
+    
+    Args:
+        values: Array of integer values
+    
+    Returns:
+        List[Tuple[int, int]]: (value, count) pairs by descending count,
+        ties broken by first occurrence
+    """
+    unique_values, first_index, counts = np.unique(values, return_index=True, return_counts=True)
+    order = np.lexsort((first_index, -counts))
+    return [(int(unique_values[i]), int(counts[i])) for i in order]
 
 def calculate_chat_statistics(messages: List[Message]) -> ChatStatistics:
     """
@@ -53,14 +71,29 @@ def calculate_chat_statistics(messages: List[Message]) -> ChatStatistics:
             busiest_hour=0
         )
     
-    # Sort messages by timestamp
-    sorted_messages = sorted(messages, key=lambda m: m.timestamp)
-    first_date = sorted_messages[0].timestamp.strftime("%Y-%m-%d")
-    last_date = sorted_messages[-1].timestamp.strftime("%Y-%m-%d")
+    # Extract everything needed from the messages in a single pass
+    total_messages = len(messages)
+    senders = []
+    hours = []
+    weekdays = []
+    days = []
+    first_timestamp = last_timestamp = messages[0].timestamp
+    for message in messages:
+        timestamp = message.timestamp
+        senders.append(message.sender)
+        hours.append(timestamp.hour)
+        weekdays.append(timestamp.weekday())
+        days.append(timestamp.toordinal())
+        if timestamp < first_timestamp:
+            first_timestamp = timestamp
+        elif timestamp > last_timestamp:
+            last_timestamp = timestamp
+    
+    first_date = first_timestamp.strftime("%Y-%m-%d")
+    last_date = last_timestamp.strftime("%Y-%m-%d")
     
     # Count messages by user
-    user_counter = Counter([message.sender for message in messages])
-    total_messages = len(messages)
+    user_counter = Counter(senders)
     
     message_count_by_user = [
         MessageCountByUser(
@@ -72,35 +105,35 @@ def calculate_chat_statistics(messages: List[Message]) -> ChatStatistics:
     ]
     
     # Count messages by day of the week
-    day_counter = Counter([message.timestamp.strftime("%A") for message in messages])
+    day_counts = most_common_values(np.array(weekdays, dtype=np.int8))
     message_count_by_day = [
         MessageCountByDay(
-            day=day,
+            day=calendar.day_name[weekday],
             count=count
         )
-        for day, count in day_counter.most_common()
+        for weekday, count in day_counts
     ]
     
     # Count messages by hour
-    hour_counter = Counter([message.timestamp.hour for message in messages])
+    hour_counts = most_common_values(np.array(hours, dtype=np.int8))
     message_count_by_hour = [
         MessageCountByHour(
             hour=hour,
             count=count
         )
-        for hour, count in sorted(hour_counter.items())
+        for hour, count in sorted(hour_counts)
     ]
     
     # Find busiest and quietest days
-    busiest_day = day_counter.most_common(1)[0][0] if day_counter else ""
-    quietest_day = day_counter.most_common()[-1][0] if day_counter else ""
+    busiest_day = message_count_by_day[0].day
+    quietest_day = message_count_by_day[-1].day
     
     # Find busiest hour
-    busiest_hour = hour_counter.most_common(1)[0][0] if hour_counter else 0
+    busiest_hour = hour_counts[0][0]
     
     # Calculate average messages per day
-    days_in_chat = len(set([message.timestamp.strftime("%Y-%m-%d") for message in messages]))
-    average_messages_per_day = total_messages / days_in_chat if days_in_chat > 0 else 0
+    days_in_chat = np.unique(np.array(days, dtype=np.int32)).size
+    average_messages_per_day = total_messages / days_in_chat
     
     return ChatStatistics(
         total_messages=total_messages,
@@ -131,19 +164,11 @@ def extract_keywords(messages: List[Message], limit: int = 20) -> KeywordAnalysi
         if message.type == "text"
     ])
     
-    # Tokenize and clean text
-    tokens = word_tokenize(combined_text.lower())
-    
-    # Filter tokens
-    filtered_tokens = [
-        token for token in tokens
-        if token.isalpha()  # Only alphabetic tokens
-        and token not in STOP_WORDS  # Not a stopword
-        and len(token) > 2  # At least 3 characters
-    ]
+    # Tokenize into alphabetic words of at least 3 characters
+    tokens = WORD_PATTERN.findall(combined_text.lower())
     
-    # Count keywords
-    keyword_counter = Counter(filtered_tokens)
+    # Count keywords, skipping stopwords without an intermediate list
+    keyword_counter = Counter(filterfalse(STOP_WORDS.__contains__, tokens))
     
     # Get top keywords
     top_keywords = [
@@ -153,5 +178,5 @@ def extract_keywords(messages: List[Message], limit: int = 20) -> KeywordAnalysi
     
     return KeywordAnalysis(
         keywords=top_keywords,
-        total_words=len(filtered_tokens)
+        total_words=sum(keyword_counter.values())
     )
\ No newline at end of file
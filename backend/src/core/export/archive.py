@@ -2,15 +2,79 @@ import zipfile
 import json
 import os
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, BinaryIO
 from datetime import datetime
 from pathlib import Path
 
 from src.models.schemas import Message
 from src.storage.local import get_media
 
+try:
+    import orjson # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logging.warning("orjson not available. Using json for archive export.")
+
 logger = logging.getLogger(__name__)
 
+def json_default(obj: Any) -> Any:
+    """
+    Serialize values the JSON encoder doesn't handle natively.
+    
+    Args:
+        obj: Value to serialize
+    
+    Returns:
+        Any: JSON-serializable representation of the value
+    """
+    if isinstance(obj, Message):
+        return {
+            "id": obj.id,
+            "timestamp": obj.timestamp,
+            "sender": obj.sender,
+            "content": obj.content,
+            "type": obj.type
+        }
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dump_json(data: Any) -> bytes:
+    """
+    Serialize data to indented JSON, using orjson when available.
+    
+    Args:
+        data: Data to serialize, may contain Message and datetime values
+    
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=json_default, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, default=json_default, indent=2).encode("utf-8")
+
+def write_json_array(stream: BinaryIO, items: Iterable[Any]):
+    """
+    Write items as an indented JSON array, one element at a time.
+    
+    The output matches dump_json(list(items)) without building the whole
+    array in memory.
+    
+    Args:
+        stream: Binary stream to write to
+        items: Items to serialize
+    """
+    opening = b"[\n  "
+    separator = opening
+    for item in items:
+        stream.write(separator)
+        # Strings never contain raw newlines in JSON, so this only shifts
+        # the element's own lines one level deeper
+        stream.write(dump_json(item).replace(b"\n", b"\n  "))
+        separator = b",\n  "
+    stream.write(b"[]" if separator is opening else b"\n]")
+
 def create_chat_archive(messages: List[Message], output_path: str, include_media: bool = True) -> str:
     """
     Create a ZIP archive containing chat messages and optionally media.
@@ -26,32 +90,23 @@ def create_chat_archive(messages: List[Message], output_path: str, include_media
     logger.info(f"Creating chat archive with {len(messages)} messages")
     
     try:
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add messages as JSON
-            messages_data = [
-                {
-                    "id": msg.id,
-                    "timestamp": msg.timestamp.isoformat(),
-                    "sender": msg.sender,
-                    "content": msg.content,
-                    "type": msg.type
-                }
-                for msg in messages
-            ]
-            
-            zipf.writestr('messages.json', json.dumps(messages_data, indent=2))
+        # JSON compresses well even at the fastest deflate level
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+            # Stream messages as JSON straight into the archive entry
+            with zipf.open('messages.json', 'w', force_zip64=True) as entry:
+                write_json_array(entry, messages)
             
             # Add chat info
             if messages:
                 chat_info = {
                     "exported_at": datetime.now().isoformat(),
                     "total_messages": len(messages),
-                    "first_message": messages[0].timestamp.isoformat(),
-                    "last_message": messages[-1].timestamp.isoformat(),
+                    "first_message": messages[0].timestamp,
+                    "last_message": messages[-1].timestamp,
                     "participants": list(set(msg.sender for msg in messages))
                 }
                 
-                zipf.writestr('chat_info.json', json.dumps(chat_info, indent=2))
+                zipf.writestr('chat_info.json', dump_json(chat_info))
             
             # Add media files if requested
             if include_media:
@@ -67,10 +122,12 @@ def create_chat_archive(messages: List[Message], output_path: str, include_media
                         media_path = get_media(media_id)
                         
                         if media_path and media_path.exists():
-                            # Add file to ZIP
+                            # Add file to ZIP uncompressed, media formats
+                            # are already compressed
                             zipf.write(
                                 media_path,
-                                f"media/{media_path.name}"
+                                f"media/{media_path.name}",
+                                compress_type=zipfile.ZIP_STORED
                             )
         
         logger.info(f"Chat archive created at {output_path}")
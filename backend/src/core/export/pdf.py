@@ -2,15 +2,224 @@ from typing import List, Optional
 import logging
 from io import BytesIO
 from datetime import datetime
+from operator import attrgetter
 from reportlab.lib.pagesizes import letter # type: ignore
 from reportlab.lib import colors # type: ignore
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle # type: ignore
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image # type: ignore
+from reportlab.lib.utils import simpleSplit # type: ignore
+from reportlab.pdfbase.pdfmetrics import stringWidth # type: ignore
+from reportlab.pdfgen import canvas # type: ignore
 
 from src.models.schemas import Message
 
 logger = logging.getLogger(__name__)
 
+# Styles are built once at import and shared by every export
+STYLES = getSampleStyleSheet()
+TITLE_STYLE = STYLES["Title"]
+HEADING_STYLE = STYLES["Heading2"]
+NORMAL_STYLE = STYLES["Normal"]
+
+MESSAGE_STYLE = ParagraphStyle(
+    "MessageStyle",
+    parent=NORMAL_STYLE,
+    fontSize=10,
+    leading=14,
+    spaceAfter=6
+)
+
+SENDER_STYLE = ParagraphStyle(
+    "SenderStyle",
+    parent=NORMAL_STYLE,
+    fontSize=9,
+    textColor=colors.blue,
+    leading=12
+)
+
+TIME_STYLE = ParagraphStyle(
+    "TimeStyle",
+    parent=NORMAL_STYLE,
+    fontSize=8,
+    textColor=colors.gray,
+    alignment=2  # Right aligned
+)
+
+DATE_STYLE = ParagraphStyle("DateStyle", parent=NORMAL_STYLE, alignment=1)  # Center aligned
+
+PAGE_MARGIN = 72
+TABLE_PADDING = 6
+
+def wrap_text(text: str, font_name: str, font_size: float, max_width: float) -> List[str]:
+    """
+    Wrap text to a width, breaking words that are too long for a line.
+    
+    simpleSplit only breaks at spaces, so long unbroken tokens such as URLs
+    are split by character, like Platypus does for long words.
+    
+    Args:
+        text: Text to wrap
+        font_name: Font the text is drawn in
+        font_size: Font size the text is drawn at
+        max_width: Maximum line width
+    
+    Returns:
+        List[str]: Lines that each fit within max_width
+    """
+    lines = []
+    for line in simpleSplit(text, font_name, font_size, max_width):
+        if stringWidth(line, font_name, font_size) <= max_width:
+            lines.append(line)
+            continue
+        
+        # Break the line at the last character that still fits, keeping at
+        # least one character per line
+        start = 0
+        width = 0.0
+        for end, char in enumerate(line):
+            char_width = stringWidth(char, font_name, font_size)
+            if width + char_width > max_width and end > start:
+                lines.append(line[start:end])
+                start = end
+                width = 0.0
+            width += char_width
+        lines.append(line[start:])
+    return lines
+
+class ChatPdfWriter:
+    """
+    Single-pass PDF writer that draws text straight onto a canvas.
+    
+    Each chat block is a few lines of known styles, so lines are wrapped and
+    drawn immediately with a running y cursor instead of building flowables
+    for a multi-pass layout.
+    """
+
+    def __init__(self, buffer: BytesIO, pagesize=letter, margin: float = PAGE_MARGIN):
+        self.canvas = canvas.Canvas(buffer, pagesize=pagesize)
+        self.page_width, self.page_height = pagesize
+        self.margin = margin
+        self.frame_width = self.page_width - 2 * margin
+        self.y = self.page_height - margin
+
+    def new_page(self):
+        """
+        Finish the current page and move the cursor to the top of the next one.
+        """
+        self.canvas.showPage()
+        self.y = self.page_height - self.margin
+
+    def ensure_space(self, height: float):
+        """
+        Start a new page if the given height doesn't fit above the bottom margin.
+        
+        Args:
+            height: Vertical space needed
+        """
+        if self.y - height < self.margin:
+            self.new_page()
+
+    def space(self, height: float):
+        """
+        Move the cursor down, like a Spacer.
+        
+        Args:
+            height: Vertical space to skip
+        """
+        self.y -= height
+
+    def paragraph(self, text: str, style: ParagraphStyle):
+        """
+        Draw wrapped text in a style, breaking pages between lines as needed.
+        
+        Args:
+            text: Plain text to draw
+            style: Paragraph style providing font, size, leading, color and alignment
+        """
+        lines = wrap_text(text, style.fontName, style.fontSize, self.frame_width)
+        if not lines:
+            return
+        
+        self.y -= style.spaceBefore
+        for line in lines:
+            if self.y - style.leading < self.margin:
+                self.new_page()
+            self.y -= style.leading
+            
+            # Font and color are reset by showPage, so set them per line
+            self.canvas.setFont(style.fontName, style.fontSize)
+            self.canvas.setFillColor(style.textColor)
+            baseline = self.y + style.leading - style.fontSize
+            if style.alignment == 1:
+                self.canvas.drawCentredString(self.margin + self.frame_width / 2, baseline, line)
+            elif style.alignment == 2:
+                self.canvas.drawRightString(self.margin + self.frame_width, baseline, line)
+            else:
+                self.canvas.drawString(self.margin, baseline, line)
+        self.y -= style.spaceAfter
+
+    def table(self, rows: List[List[str]], col_widths: List[float], style: ParagraphStyle):
+        """
+        Draw a centered grid of single-line cells with a shaded first column.
+        
+        Args:
+            rows: Cell text per row
+            col_widths: Width of each column
+            style: Style for the cell text
+        """
+        row_height = style.leading + 2 * TABLE_PADDING
+        table_width = sum(col_widths)
+        left = self.margin + (self.frame_width - table_width) / 2
+        
+        for row in rows:
+            self.ensure_space(row_height)
+            bottom = self.y - row_height
+            
+            self.canvas.setFillColor(colors.lightgrey)
+            self.canvas.rect(left, bottom, col_widths[0], row_height, stroke=0, fill=1)
+            
+            self.canvas.setStrokeColor(colors.grey)
+            self.canvas.setLineWidth(0.5)
+            self.canvas.setFont(style.fontName, style.fontSize)
+            self.canvas.setFillColor(style.textColor)
+            x = left
+            for cell, width in zip(row, col_widths):
+                self.canvas.rect(x, bottom, width, row_height, stroke=1, fill=0)
+                self.canvas.drawString(x + TABLE_PADDING, bottom + TABLE_PADDING + style.leading - style.fontSize, cell)
+                x += width
+            
+            self.y = bottom
+
+    def save(self):
+        """
+        Finish the document and write it to the buffer.
+        """
+        self.canvas.save()
+
+def get_message_text(message: Message, include_media: bool) -> str:
+    """
+    Get the text shown for a message in the PDF.
+    
+    Args:
+        message: Message to describe
+        include_media: Whether media messages get a media placeholder
+    
+    Returns:
+        str: Message text or placeholder
+    """
+    if message.type == "text":
+        return message.content
+    elif message.type == "image" and include_media:
+        # In a real app, you would draw the actual image here
+        return "[Image]"
+    elif message.type == "video" and include_media:
+        return "[Video]"
+    elif message.type == "audio" and include_media:
+        return "[Audio]"
+    elif message.type == "file" and include_media:
+        return f"[File: {message.content}]"
+    else:
+        return f"[{message.type}]"
+
 def generate_chat_pdf(messages: List[Message], include_media: bool = True) -> bytes:
     """
     Generate a PDF file from the chat messages.
@@ -24,70 +233,30 @@ def generate_chat_pdf(messages: List[Message], include_media: bool = True) -> by
     """
     logger.info(f"Generating PDF with {len(messages)} messages")
     
-    # Create PDF buffer
+    # Create PDF buffer and writer
     buffer = BytesIO()
-    
-    # Create PDF document
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=letter,
-        rightMargin=72,
-        leftMargin=72,
-        topMargin=72,
-        bottomMargin=72
-    )
-    
-    # Get styles
-    styles = getSampleStyleSheet()
-    title_style = styles["Title"]
-    heading_style = styles["Heading2"]
-    normal_style = styles["Normal"]
-    
-    # Create custom styles
-    message_style = ParagraphStyle(
-        "MessageStyle",
-        parent=normal_style,
-        fontSize=10,
-        leading=14,
-        spaceAfter=6
-    )
-    
-    sender_style = ParagraphStyle(
-        "SenderStyle",
-        parent=normal_style,
-        fontSize=9,
-        textColor=colors.blue,
-        leading=12
-    )
-    
-    time_style = ParagraphStyle(
-        "TimeStyle",
-        parent=normal_style,
-        fontSize=8,
-        textColor=colors.gray,
-        alignment=2  # Right aligned
-    )
-    
-    # Create document elements
-    elements = []
+    writer = ChatPdfWriter(buffer)
     
     # Add title
-    elements.append(Paragraph("WhatsApp Chat Export", title_style))
-    elements.append(Spacer(1, 12))
+    writer.paragraph("WhatsApp Chat Export", TITLE_STYLE)
+    writer.space(12)
     
     # Add export date
     export_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    elements.append(Paragraph(f"Exported on: {export_date}", normal_style))
-    elements.append(Spacer(1, 24))
+    writer.paragraph(f"Exported on: {export_date}", NORMAL_STYLE)
+    writer.space(24)
+    
+    # Sort once, the summary and the message list both use this order
+    sorted_messages = sorted(messages, key=attrgetter("timestamp"))
     
     # Add chat summary
-    if messages:
-        chat_start = min(m.timestamp for m in messages).strftime("%Y-%m-%d")
-        chat_end = max(m.timestamp for m in messages).strftime("%Y-%m-%d")
-        unique_senders = len(set(m.sender for m in messages))
+    if sorted_messages:
+        chat_start = sorted_messages[0].timestamp.strftime("%Y-%m-%d")
+        chat_end = sorted_messages[-1].timestamp.strftime("%Y-%m-%d")
+        unique_senders = len({m.sender for m in sorted_messages})
         
-        elements.append(Paragraph("Chat Summary", heading_style))
-        elements.append(Spacer(1, 6))
+        writer.paragraph("Chat Summary", HEADING_STYLE)
+        writer.space(6)
         
         summary_data = [
             ["Date Range", f"{chat_start} to {chat_end}"],
@@ -95,64 +264,38 @@ def generate_chat_pdf(messages: List[Message], include_media: bool = True) -> by
             ["Participants", str(unique_senders)]
         ]
         
-        summary_table = Table(summary_data, colWidths=[100, 300])
-        summary_table.setStyle(TableStyle([
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('PADDING', (0, 0), (-1, -1), 6),
-        ]))
-        
-        elements.append(summary_table)
-        elements.append(Spacer(1, 24))
+        writer.table(summary_data, [100, 300], NORMAL_STYLE)
+        writer.space(24)
     
     # Add messages
-    elements.append(Paragraph("Messages", heading_style))
-    elements.append(Spacer(1, 12))
+    writer.paragraph("Messages", HEADING_STYLE)
+    writer.space(12)
     
     current_date = None
     
-    for message in sorted(messages, key=lambda m: m.timestamp):
+    for message in sorted_messages:
+        message_time = message.timestamp
+        
         # Add date separator if date changes
-        message_date = message.timestamp.strftime("%Y-%m-%d")
+        message_date = message_time.date()
         if message_date != current_date:
             current_date = message_date
-            elements.append(Spacer(1, 12))
-            elements.append(
-                Paragraph(
-                    f"--- {message.timestamp.strftime('%A, %B %d, %Y')} ---",
-                    ParagraphStyle("DateStyle", parent=normal_style, alignment=1)  # Center aligned
-                )
-            )
-            elements.append(Spacer(1, 6))
-        
-        # Format message
-        timestamp = message.timestamp.strftime("%H:%M:%S")
-        
-        # Add sender
-        elements.append(Paragraph(f"{message.sender}", sender_style))
+            writer.space(12)
+            writer.paragraph(f"--- {message_time.strftime('%A, %B %d, %Y')} ---", DATE_STYLE)
+            writer.space(6)
         
-        # Add message content based on type
-        if message.type == "text":
-            elements.append(Paragraph(message.content, message_style))
-        elif message.type == "image" and include_media:
-            elements.append(Paragraph("[Image]", message_style))
-            # In a real app, you would add the actual image here
-            # elements.append(Image(image_path, width=200, height=150))
-        elif message.type == "video" and include_media:
-            elements.append(Paragraph("[Video]", message_style))
-        elif message.type == "audio" and include_media:
-            elements.append(Paragraph("[Audio]", message_style))
-        elif message.type == "file" and include_media:
-            elements.append(Paragraph(f"[File: {message.content}]", message_style))
-        else:
-            elements.append(Paragraph(f"[{message.type}]", message_style))
+        # Format message time without a strftime call per message
+        timestamp = f"{message_time.hour:02d}:{message_time.minute:02d}:{message_time.second:02d}"
         
-        # Add timestamp
-        elements.append(Paragraph(timestamp, time_style))
-        elements.append(Spacer(1, 6))
+        # Keep the sender with the first line of the message
+        writer.ensure_space(SENDER_STYLE.leading + MESSAGE_STYLE.leading)
+        writer.paragraph(message.sender, SENDER_STYLE)
+        writer.paragraph(get_message_text(message, include_media), MESSAGE_STYLE)
+        writer.paragraph(timestamp, TIME_STYLE)
+        writer.space(6)
     
     # Build PDF
-    doc.build(elements)
+    writer.save()
     
     # Get PDF data
     pdf_data = buffer.getvalue()
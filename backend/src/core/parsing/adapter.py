@@ -17,6 +17,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Regex for WhatsApp timestamp and sender, compiled once at import.
+# Used with .match() on stripped lines, so no ^/$ anchors are needed.
+MESSAGE_LINE_PATTERN = re.compile(
+    r'\[(\d{2}/\d{2}/\d{4}, \d{2}:\d{2}:\d{2})\] ([^:]+): (.+)'
+)
+
 def parse_whatsapp_chat(file_path: str, user_identity: str) -> List[Message]:
     """
     Parse a WhatsApp chat export file and extract messages.
@@ -66,10 +72,6 @@ def parse_with_python(file_path: str, user_identity: str) -> List[Message]:
     """
     Python fallback implementation for parsing WhatsApp chat exports.
     """
-    # Regex for WhatsApp timestamp and sender
-    pattern = r'^\[(\d{2}/\d{2}/\d{4}, \d{2}:\d{2}:\d{2})\] ([^:]+): (.+)$'
-    regex = re.compile(pattern)
-    
     messages = []
     current_message = None
     
@@ -77,7 +79,7 @@ def parse_with_python(file_path: str, user_identity: str) -> List[Message]:
         with open(file_path, 'r', encoding='utf-8') as file:
             for line in file:
                 line = line.strip()
-                match = regex.match(line)
+                match = MESSAGE_LINE_PATTERN.match(line)
                 
                 if match:
                     # If we have a current message being built, add it to the list
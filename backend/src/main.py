@@ -4,6 +4,7 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
 import time
 import logging
 from typing import Dict, Any, List
@@ -19,11 +20,23 @@ logger = logging.getLogger("memories-api")
 from src.api.v1.chats import router as chats_router
 from src.api.v1.export import router as export_router
 from src.api.v1.audio import router as audio_router
+from src.utils.executors import shutdown_executors
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Log when the server starts and release shared worker pools when it stops
+    """
+    logger.info("🚀 WhatsApp Memory Vault API server started")
+    logger.info(f"API Documentation available at: http://localhost:8000/docs")
+    yield
+    shutdown_executors()
 
 app = FastAPI(
     title="Memories API", 
     version="1.0.0",
     description="API for managing and analyzing WhatsApp chat exports",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware to allow requests from the frontend
@@ -202,17 +215,4 @@ async def catch_all(request: Request, path: str) -> JSONResponse:
             "suggestion": "Check the API documentation at /docs"
         },
         media_type="application/json"
-    )
-
-# Add startup event handler
-@app.on_event("startup")
-async def startup_event():
-    """
-    Log when the server starts
-    """
-    logger.info("🚀 WhatsApp Memory Vault API server started")
-    logger.info(f"API Documentation available at: http://localhost:8000/docs")
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    )
\ No newline at end of file
@@ -0,0 +1,114 @@
+from typing import BinaryIO, Tuple
+from pathlib import Path
+import hashlib
+import logging
+import os
+
+from src.utils.executors import run_file_io
+
+# mutagen only parses container headers, so reading a duration never
+# decodes the audio itself
+try:
+    from mutagen import File as MutagenFile # type: ignore
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
+    logging.warning("mutagen not available. Audio durations will not be read.")
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+def save_upload(src: BinaryIO, dst_path: Path, max_size: int) -> Tuple[int, str]:
+    """
+    Copy an uploaded file to disk in chunks, hashing it on the way.
+    
+    The parent directory of dst_path is created if needed. The data is
+    written to a ".part" file next to dst_path and only renamed into place
+    once complete, so dst_path never holds a partial upload.
+    
+    Args:
+        src: File object of the upload
+        dst_path: Path to write the file to
+        max_size: Maximum number of bytes to accept
+    
+    Returns:
+        Tuple[int, str]: Number of bytes read and SHA-256 hex digest of the
+        written data. The size is larger than max_size if the limit was
+        exceeded, in which case copying stops early and dst_path is not created
+    """
+    tmp_path = dst_path.with_name(dst_path.name + ".part")
+    file_size = 0
+    hasher = hashlib.sha256()
+    
+    # Read every chunk into the same buffer instead of allocating new bytes.
+    # SpooledTemporaryFile (UploadFile.file) only has readinto from Python
+    # 3.11, so fall back to read() on older versions.
+    if hasattr(src, "readinto"):
+        buffer = bytearray(UPLOAD_CHUNK_SIZE)
+        view = memoryview(buffer)
+        
+        def read_chunk():
+            return view[:src.readinto(buffer)]
+    else:
+        def read_chunk():
+            return src.read(UPLOAD_CHUNK_SIZE)
+    
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with open(tmp_path, "wb") as f:
+            while chunk := read_chunk():
+                file_size += len(chunk)
+                if file_size > max_size:
+                    break
+                hasher.update(chunk)
+                f.write(chunk)
+            
+            if file_size <= max_size:
+                f.flush()
+                os.fsync(f.fileno())
+        
+        if file_size <= max_size:
+            os.replace(tmp_path, dst_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    
+    return file_size, hasher.hexdigest()
+
+async def save_upload_async(src: BinaryIO, dst_path: Path, max_size: int) -> Tuple[int, str]:
+    """
+    Run save_upload on the file I/O thread pool.
+    
+    Args:
+        src: File object of the upload
+        dst_path: Path to write the file to
+        max_size: Maximum number of bytes to accept
+    
+    Returns:
+        Tuple[int, str]: Number of bytes read and SHA-256 hex digest
+    """
+    return await run_file_io(save_upload, src, dst_path, max_size)
+
+def get_audio_duration(audio_path: Path) -> float:
+    """
+    Get the duration of an audio file from its metadata.
+    
+    Args:
+        audio_path: Path to the audio file
+    
+    Returns:
+        float: Duration in seconds, or 0.0 if it can't be determined
+    """
+    if not MUTAGEN_AVAILABLE:
+        return 0.0
+    
+    try:
+        audio_file = MutagenFile(str(audio_path))
+    except Exception as e:
+        logger.warning(f"Could not read audio metadata: {e}")
+        return 0.0
+    
+    if audio_file is None or audio_file.info is None:
+        return 0.0
+    
+    return float(audio_file.info.length)
\ No newline at end of file
@@ -0,0 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Blocking disk I/O gets its own bounded pool so upload bursts don't starve
+# other work queued on the event loop's default executor
+FILE_IO_MAX_WORKERS = 32
+
+_file_io_executor: Optional[ThreadPoolExecutor] = None
+
+def get_file_io_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared file I/O thread pool, creating it on first use.
+    
+    Returns:
+        ThreadPoolExecutor: Thread pool for blocking file operations
+    """
+    global _file_io_executor
+    if _file_io_executor is None:
+        _file_io_executor = ThreadPoolExecutor(
+            max_workers=FILE_IO_MAX_WORKERS,
+            thread_name_prefix="file-io"
+        )
+    return _file_io_executor
+
+async def run_file_io(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a blocking file operation on the file I/O thread pool.
+    
+    Args:
+        func: Function to run
+        *args: Positional arguments for the function
+    
+    Returns:
+        Any: Return value of the function
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_file_io_executor(), func, *args)
+
+def shutdown_executors():
+    """
+    Shut down the shared executors, waiting for pending work to finish.
+    """
+    global _file_io_executor
+    if _file_io_executor is not None:
+        logger.info("Shutting down file I/O executor")
+        _file_io_executor.shutdown(wait=True)
+        _file_io_executor = None
\ No newline at end of file
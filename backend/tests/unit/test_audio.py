@@ -0,0 +1,102 @@
+import pytest # type: ignore
+import hashlib
+import io
+import tempfile
+import wave
+from collections import Counter
+
+from api.v1.audio import router # type: ignore
+from utils.audio import save_upload, get_audio_duration # type: ignore
+
+def test_audio_routes_registered_once():
+    """Test that no audio route is registered more than once."""
+    routes = Counter(
+        (route.path, method)
+        for route in router.routes
+        for method in route.methods
+    )
+    assert all(count == 1 for count in routes.values())
+
+def test_save_upload(tmp_path):
+    """Test saving an upload within the size limit."""
+    content = b"audio data" * 1000
+    dst_path = tmp_path / "recording.mp3"
+
+    file_size, file_hash = save_upload(io.BytesIO(content), dst_path, max_size=len(content))
+
+    assert file_size == len(content)
+    assert file_hash == hashlib.sha256(content).hexdigest()
+    assert dst_path.read_bytes() == content
+    assert list(tmp_path.iterdir()) == [dst_path]
+
+def test_save_upload_creates_directory(tmp_path):
+    """Test that the destination directory is created if it's missing."""
+    content = b"audio data"
+    dst_path = tmp_path / "storage" / "media" / "recording.mp3"
+
+    file_size, _ = save_upload(io.BytesIO(content), dst_path, max_size=len(content))
+
+    assert file_size == len(content)
+    assert dst_path.read_bytes() == content
+
+def test_save_upload_spooled_file(tmp_path):
+    """Test saving from a SpooledTemporaryFile, as used by UploadFile."""
+    content = b"audio data" * 1000
+    dst_path = tmp_path / "recording.mp3"
+
+    with tempfile.SpooledTemporaryFile(max_size=1024) as upload_file:
+        upload_file.write(content)
+        upload_file.seek(0)
+        file_size, file_hash = save_upload(upload_file, dst_path, max_size=len(content))
+
+    assert file_size == len(content)
+    assert file_hash == hashlib.sha256(content).hexdigest()
+    assert dst_path.read_bytes() == content
+
+def test_save_upload_without_readinto(tmp_path):
+    """Test saving from a file object that only supports read()."""
+    content = b"audio data" * 1000
+    dst_path = tmp_path / "recording.mp3"
+
+    class ReadOnlyFile:
+        def __init__(self, data):
+            self._data = io.BytesIO(data)
+
+        def read(self, size=-1):
+            return self._data.read(size)
+
+    file_size, file_hash = save_upload(ReadOnlyFile(content), dst_path, max_size=len(content))
+
+    assert file_size == len(content)
+    assert file_hash == hashlib.sha256(content).hexdigest()
+    assert dst_path.read_bytes() == content
+
+def test_save_upload_too_large(tmp_path):
+    """Test that an oversized upload leaves no files behind."""
+    content = b"audio data" * 1000
+    dst_path = tmp_path / "recording.mp3"
+
+    file_size, _ = save_upload(io.BytesIO(content), dst_path, max_size=len(content) - 1)
+
+    assert file_size > len(content) - 1
+    assert not dst_path.exists()
+    assert list(tmp_path.iterdir()) == []
+
+def test_get_audio_duration(tmp_path):
+    """Test reading the duration of a WAV file."""
+    pytest.importorskip("mutagen")
+    audio_path = tmp_path / "recording.wav"
+    with wave.open(str(audio_path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(8000)
+        wav_file.writeframes(b"\x00\x00" * 16000)
+
+    assert get_audio_duration(audio_path) == pytest.approx(2.0)
+
+def test_get_audio_duration_unknown_format(tmp_path):
+    """Test that unreadable files have no duration."""
+    audio_path = tmp_path / "recording.mp3"
+    audio_path.write_bytes(b"not really audio")
+
+    assert get_audio_duration(audio_path) == 0.0
\ No newline at end of file
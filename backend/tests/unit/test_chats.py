@@ -0,0 +1,149 @@
+import pytest # type: ignore
+import asyncio
+import threading
+from datetime import datetime
+
+from api.v1 import chats # type: ignore
+
+@pytest.fixture(autouse=True)
+def chat_state(monkeypatch):
+    """Give each test its own chats and empty analysis caches."""
+    sample_chats = [dict(chat) for chat in chats.sample_chats]
+    monkeypatch.setattr(chats, "sample_chats", sample_chats)
+    monkeypatch.setattr(chats, "sample_chats_by_id", {chat["id"]: chat for chat in sample_chats})
+    monkeypatch.setattr(chats, "_statistics_cache", {})
+    monkeypatch.setattr(chats, "_keywords_cache", {})
+
+def counting_analysis(monkeypatch, wait_for=None, fail_first=False):
+    """Replace the statistics function with one that records its calls."""
+    calls = []
+
+    def analysis(messages):
+        calls.append(len(messages))
+        if wait_for is not None:
+            wait_for.wait(timeout=5)
+        if fail_first and len(calls) == 1:
+            raise RuntimeError("analysis failed")
+        return {"total_messages": len(messages)}
+
+    monkeypatch.setattr(chats, "calculate_chat_statistics", analysis)
+    return calls
+
+def test_concurrent_requests_share_analysis(monkeypatch):
+    """Test that concurrent requests for one chat run the analysis once."""
+    release = threading.Event()
+    calls = counting_analysis(monkeypatch, wait_for=release)
+
+    async def run():
+        requests = [asyncio.ensure_future(chats.get_chat_statistics("1")) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*requests)
+
+    results = asyncio.run(run())
+
+    assert calls == [2]
+    assert all(result is results[0] for result in results)
+    assert len(chats._statistics_cache) == 1
+
+def test_cancelled_request_keeps_shared_analysis(monkeypatch):
+    """Test that cancelling one request doesn't cancel the analysis for others."""
+    release = threading.Event()
+    calls = counting_analysis(monkeypatch, wait_for=release)
+
+    async def run():
+        first = asyncio.ensure_future(chats.get_chat_statistics("1"))
+        second = asyncio.ensure_future(chats.get_chat_statistics("1"))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    try:
+        assert asyncio.run(run()) == {"total_messages": 2}
+    finally:
+        release.set()
+    assert calls == [2]
+
+def test_failed_analysis_is_retried(monkeypatch):
+    """Test that a failed analysis is evicted and the next request retries it."""
+    calls = counting_analysis(monkeypatch, fail_first=True)
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await chats.get_chat_statistics("1")
+        assert chats._statistics_cache == {}
+        return await chats.get_chat_statistics("1")
+
+    assert asyncio.run(run()) == {"total_messages": 2}
+    assert calls == [2, 2]
+
+def test_cancelled_analysis_is_retried(monkeypatch):
+    """Test that a cancelled analysis is evicted and the next request retries it."""
+    release = threading.Event()
+    calls = counting_analysis(monkeypatch, wait_for=release)
+
+    async def run():
+        request = asyncio.ensure_future(chats.get_chat_statistics("1"))
+        await asyncio.sleep(0.05)
+        (future,) = chats._statistics_cache.values()
+        future.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+        await asyncio.sleep(0)
+        assert chats._statistics_cache == {}
+        return await chats.get_chat_statistics("1")
+
+    try:
+        assert asyncio.run(run()) == {"total_messages": 2}
+    finally:
+        release.set()
+    assert calls == [2, 2]
+
+def test_create_chat_replaces_stale_analysis(monkeypatch):
+    """Test that creating a chat drops cached results for the same ID and precomputes statistics."""
+    calls = counting_analysis(monkeypatch)
+    chat = chats.Chat(
+        id="1",
+        title="Family Chat",
+        participants=["Mom", "Me"],
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 6, 1),
+        messages=[
+            chats.Message(id=f"m{i}", content="Pizza tonight", sender="Me", timestamp=datetime(2025, 6, 1))
+            for i in range(3)
+        ]
+    )
+
+    async def run():
+        stale = await chats.get_chat_statistics("1")
+        await chats.get_chat_keywords("1", top_n=10)
+        await chats.create_chat(chat)
+        assert [(key[0], key[2]) for key in chats._statistics_cache] == [("1", 3)]
+        assert chats._keywords_cache == {}
+        return stale, await chats.get_chat_statistics("1")
+
+    stale, fresh = asyncio.run(run())
+
+    assert stale == {"total_messages": 2}
+    assert fresh == {"total_messages": 3}
+    assert calls == [2, 3]
+
+def test_keywords_cache_keyed_by_top_n():
+    """Test that keyword results for different top_n values are cached separately."""
+    async def run():
+        return (
+            await chats.get_chat_keywords("1", top_n=1),
+            await chats.get_chat_keywords("1", top_n=5),
+            await chats.get_chat_keywords("1", top_n=1)
+        )
+
+    top_one, top_five, top_one_again = asyncio.run(run())
+
+    assert top_one["count"] == 1
+    assert top_five["count"] > 1
+    assert top_one_again == top_one
+    assert sorted(key[-1] for key in chats._keywords_cache) == [1, 5]
\ No newline at end of file
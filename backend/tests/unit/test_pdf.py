@@ -0,0 +1,28 @@
+import pytest # type: ignore
+from datetime import datetime
+from reportlab.pdfbase.pdfmetrics import stringWidth # type: ignore
+from core.export.pdf import wrap_text, generate_chat_pdf # type: ignore
+from models.schemas import Message # type: ignore
+
+def test_wrap_text_breaks_long_words():
+    """Test that tokens wider than a line are split across lines."""
+    url = "https://example.com/" + "a" * 300
+    lines = wrap_text(f"see {url} ok", "Helvetica", 10, 468)
+
+    assert len(lines) > 3
+    assert all(stringWidth(line, "Helvetica", 10) <= 468 for line in lines)
+    assert "".join(lines[1:-1]) == url
+
+def test_wrap_text_short_text():
+    """Test that text that fits is left as a single line."""
+    assert wrap_text("hello world", "Helvetica", 10, 468) == ["hello world"]
+    assert wrap_text("", "Helvetica", 10, 468) == []
+
+def test_generate_chat_pdf():
+    """Test generating a PDF with a long unbroken message."""
+    messages = [
+        Message(id="1", timestamp=datetime(2023, 5, 18, 8, 0, 0), sender="John", content="x" * 2000)
+    ]
+
+    pdf_data = generate_chat_pdf(messages)
+    assert pdf_data.startswith(b"%PDF")
\ No newline at end of file
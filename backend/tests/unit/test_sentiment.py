@@ -1,6 +1,6 @@
 import pytest # type: ignore
 from datetime import datetime
-from core.analysis.sentiment import analyze_chat_sentiment, get_sentiment_label # type: ignore
+from core.analysis.sentiment import analyze_chat_sentiment, analyze_message_sentiment, get_sentiment_label, get_sentiment_labels # type: ignore
 from models.schemas import Message, MessageType, SentimentLabel # type: ignore
 
 def test_get_sentiment_label():
@@ -11,6 +11,11 @@ def test_get_sentiment_label():
     assert get_sentiment_label(-0.04) == SentimentLabel.NEUTRAL
     assert get_sentiment_label(-0.5) == SentimentLabel.NEGATIVE
 
+def test_get_sentiment_labels():
+    """Test vectorized sentiment labels match the scalar version."""
+    scores = [0.5, 0.05, 0.04, 0.0, -0.04, -0.05, -0.5]
+    assert list(get_sentiment_labels(scores)) == [get_sentiment_label(score) for score in scores]
+
 def test_analyze_chat_sentiment_empty():
     """Test sentiment analysis with empty message list."""
     result = analyze_chat_sentiment([])
@@ -118,4 +123,39 @@ def test_analyze_chat_sentiment_non_text():
     
     result = analyze_chat_sentiment(messages)
     # Non-text messages should be ignored
-    assert result.overall.label == SentimentLabel.POSITIVE
\ No newline at end of file
+    assert result.overall.label == SentimentLabel.POSITIVE
+
+def test_analyze_chat_sentiment_daily_mean():
+    """Test that each day's score is the mean of its message scores."""
+    messages = [
+        Message(
+            id="1", 
+            timestamp=datetime(2023, 5, 18, 8, 0, 0), 
+            sender="John", 
+            content="I'm very happy today! This is wonderful.", 
+            type=MessageType.TEXT
+        ),
+        Message(
+            id="2", 
+            timestamp=datetime(2023, 5, 18, 9, 0, 0), 
+            sender="Alice", 
+            content="I'm sad and upset today.", 
+            type=MessageType.TEXT
+        ),
+        Message(
+            id="3", 
+            timestamp=datetime(2023, 5, 19, 9, 0, 0), 
+            sender="Alice", 
+            content="I'm happy today!", 
+            type=MessageType.TEXT
+        )
+    ]
+    
+    result = analyze_chat_sentiment(messages)
+    expected = (
+        analyze_message_sentiment(messages[0]).score
+        + analyze_message_sentiment(messages[1]).score
+    ) / 2
+    assert result.daily[0].message_count == 2
+    assert result.daily[0].sentiment.score == pytest.approx(expected)
+    assert result.daily[1].message_count == 1
\ No newline at end of file
@@ -0,0 +1,45 @@
+import pytest # type: ignore
+from datetime import datetime
+from core.analysis.statistics import calculate_chat_statistics, extract_keywords # type: ignore
+from models.schemas import Message, MessageType # type: ignore
+
+def test_calculate_chat_statistics_empty():
+    """Test statistics with empty message list."""
+    result = calculate_chat_statistics([])
+    assert result.total_messages == 0
+    assert result.message_count_by_user == []
+    assert result.busiest_day == ""
+
+def test_calculate_chat_statistics():
+    """Test statistics counts by user, day and hour."""
+    messages = [
+        Message(id="1", timestamp=datetime(2023, 5, 18, 8, 0, 0), sender="John", content="Hi"),
+        Message(id="2", timestamp=datetime(2023, 5, 18, 8, 30, 0), sender="Alice", content="Hello"),
+        Message(id="3", timestamp=datetime(2023, 5, 19, 21, 0, 0), sender="John", content="Bye")
+    ]
+
+    result = calculate_chat_statistics(messages)
+    assert result.total_messages == 3
+    assert result.date_range == {"start": "2023-05-18", "end": "2023-05-19"}
+    assert result.message_count_by_user[0].user == "John"
+    assert result.message_count_by_user[0].count == 2
+    assert result.busiest_day == "Thursday"
+    assert result.quietest_day == "Friday"
+    assert result.busiest_hour == 8
+    assert [(item.hour, item.count) for item in result.message_count_by_hour] == [(8, 2), (21, 1)]
+    assert result.average_messages_per_day == pytest.approx(1.5)
+
+def test_extract_keywords():
+    """Test keyword extraction skips stopwords, short words and non-text messages."""
+    messages = [
+        Message(id="1", timestamp=datetime(2023, 5, 18, 8, 0, 0), sender="John", content="The pizza was great, pizza again?"),
+        Message(id="2", timestamp=datetime(2023, 5, 18, 9, 0, 0), sender="Alice", content="Pizza on 42nd st is ok"),
+        Message(id="3", timestamp=datetime(2023, 5, 18, 9, 5, 0), sender="Alice", content="<Media omitted>", type=MessageType.IMAGE)
+    ]
+
+    result = extract_keywords(messages, limit=2)
+    assert result.keywords[0].word == "pizza"
+    assert result.keywords[0].count == 3
+    assert len(result.keywords) == 2
+    assert result.total_words == 4
+    assert all(item.word != "media" for item in result.keywords)
\ No newline at end of file